@@ -8,7 +8,7 @@ import logging
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -18,6 +18,7 @@ from opd.db.models import (
     GlobalCapabilityConfig,
     Project,
     ProjectCapabilityConfig,
+    Story,
     WorkspaceStatus,
 )
 from opd.db.session import get_session_factory
@@ -161,19 +162,24 @@ async def create_project(req: CreateProjectRequest, db: AsyncSession = Depends(g
 
 @router.get("")
 async def list_projects(db: AsyncSession = Depends(get_db)):
+    # Column select + COUNT: the list view never needs full Project/Story rows
     result = await db.execute(
-        select(Project).options(selectinload(Project.stories))
+        select(
+            Project.id, Project.name, Project.repo_url, Project.workspace_status,
+            func.count(Story.id),
+        )
+        .outerjoin(Story, Story.project_id == Project.id)
+        .group_by(Project.id)
     )
-    projects = result.scalars().all()
     return [
         {
-            "id": p.id,
-            "name": p.name,
-            "repo_url": p.repo_url,
-            "story_count": len(p.stories),
-            "workspace_status": p.workspace_status.value,
+            "id": pid,
+            "name": name,
+            "repo_url": repo_url,
+            "story_count": story_count,
+            "workspace_status": workspace_status.value,
         }
-        for p in projects
+        for pid, name, repo_url, workspace_status, story_count in result.all()
     ]
 
 
@@ -186,7 +192,7 @@ async def get_project(project_id: int, db: AsyncSession = Depends(get_db),
         .options(
             selectinload(Project.rules),
             selectinload(Project.skills),
-            selectinload(Project.stories),
+            selectinload(Project.stories).load_only(Story.id, Story.title, Story.status),
             selectinload(Project.capability_configs).selectinload(
                 ProjectCapabilityConfig.global_config
             ),
@@ -27,6 +27,7 @@ from opd.db.models import (
     StoryStatus,
     WorkspaceStatus,
 )
+from opd.db.round_helpers import get_active_round
 from opd.db.session import get_session_factory
 from opd.engine.hashing import should_skip_ai
 from opd.engine.notify import send_notification
@@ -138,7 +139,7 @@ async def get_story(
                 "id": t.id, "title": t.title, "description": t.description,
                 "order": t.order, "depends_on": t.depends_on,
             }
-            for t in sorted(story.tasks, key=lambda t: t.order)
+            for t in story.tasks  # ordered by Task.order in SQL
         ],
         "rounds": [
             {
@@ -299,10 +300,7 @@ async def chat_message(
     orch: Orchestrator = Depends(get_orch),
 ):
     """Send a user message to refine document via AI conversation."""
-    result = await db.execute(
-        select(Story).where(Story.id == story_id).options(selectinload(Story.rounds))
-    )
-    story = result.scalar_one_or_none()
+    story = await db.get(Story, story_id)
     if not story:
         raise HTTPException(status_code=404, detail="Story not found")
     status = ensure_status_value(story.status)
@@ -313,9 +311,7 @@ async def chat_message(
             status_code=400, detail=f"Chat only available in {'/'.join(chat_stages)} stages"
         )
 
-    active_round = next(
-        (r for r in story.rounds if r.status == RoundStatus.active), None,
-    )
+    active_round = await get_active_round(db, story_id)
     if not active_round:
         raise HTTPException(status_code=404, detail="No active round")
 
@@ -338,15 +334,13 @@ async def stream_messages(story_id: int, mode: str = "",
         mode=chat  — only replay chat messages (skip initial stage execution output)
     """
     result = await db.execute(
-        select(Story).where(Story.id == story_id).options(selectinload(Story.rounds))
+        select(Story).where(Story.id == story_id).options(selectinload(Story.project))
     )
     story = result.scalar_one_or_none()
     if not story:
         raise HTTPException(status_code=404, detail="Story not found")
 
-    active_round = next(
-        (r for r in story.rounds if r.status == RoundStatus.active), None
-    )
+    active_round = await get_active_round(db, story_id)
     if not active_round:
         raise HTTPException(status_code=404, detail="No active round")
 
@@ -363,30 +357,21 @@ async def stream_messages(story_id: int, mode: str = "",
 
         from opd.engine.ai_message_storage import read_ai_message_content
 
-        if chat_only:
-            replay = False
-            for msg in all_msgs:
-                if msg.role == AIMessageRole.user:
-                    replay = True
-                if replay:
-                    try:
-                        content = read_ai_message_content(msg, story.project)
-                        event = {"type": msg.role.value, "content": content}
-                        yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
-                    except ValueError as e:
-                        logger.error("Failed to read message %s: %s", msg.id, e)
-                        error_event = {"type": "error", "content": f"消息读取失败: {e}"}
-                        yield f"data: {json.dumps(error_event, ensure_ascii=False)}\n\n"
-        else:
-            for msg in all_msgs:
-                try:
-                    content = read_ai_message_content(msg, story.project)
-                    event = {"type": msg.role.value, "content": content}
-                    yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
-                except ValueError as e:
-                    logger.error("Failed to read message %s: %s", msg.id, e)
-                    error_event = {"type": "error", "content": f"消息读取失败: {e}"}
-                    yield f"data: {json.dumps(error_event, ensure_ascii=False)}\n\n"
+        # Chat mode replays from the first user message on; otherwise everything
+        replay = not chat_only
+        for msg in all_msgs:
+            if not replay:
+                if msg.role != AIMessageRole.user:
+                    continue
+                replay = True
+            try:
+                content = read_ai_message_content(msg, story.project)
+                event = {"type": msg.role.value, "content": content}
+                yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+            except ValueError as e:
+                logger.error("Failed to read message %s: %s", msg.id, e)
+                error_event = {"type": "error", "content": f"消息读取失败: {e}"}
+                yield f"data: {json.dumps(error_event, ensure_ascii=False)}\n\n"
 
         queue = orch.subscribe(round_id)
         try:
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -116,11 +116,8 @@ async def rollback_story(
         (r for r in story.rounds if r.status == RoundStatus.active), None,
     )
     if active_round:
-        msg_result = await db.execute(
-            select(AIMessage).where(AIMessage.round_id == active_round.id)
-        )
-        for msg in msg_result.scalars().all():
-            await db.delete(msg)
+        # Single DELETE; no need to load every message row just to remove it
+        await db.execute(delete(AIMessage).where(AIMessage.round_id == active_round.id))
 
     story.status = target
     await db.flush()
@@ -112,9 +112,13 @@ async def _post_coding_create_pr(
         return None
 
 
+# Outermost JSON array in the AI's clarification output (may be wrapped in prose)
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+
 def _save_clarifications(db, story: Story, raw_text: str) -> None:
     """Parse AI-generated questions JSON and save as Clarification records."""
-    json_match = re.search(r"\[.*\]", raw_text, re.DOTALL)
+    json_match = _JSON_ARRAY_RE.search(raw_text)
     if not json_match:
         logger.warning("Could not find JSON array in clarification output for story %s", story.id)
         return
@@ -396,8 +400,9 @@ def _start_chat_ai(story_id: int, user_message: str, orch: Orchestrator,
                     round_id = str(active_round.id)
 
                     # Load conversation history
+                    # Only role/content are needed; skip ORM hydration of full rows
                     msg_result = await db.execute(
-                        select(AIMessage)
+                        select(AIMessage.role, AIMessage.content)
                         .where(
                             AIMessage.round_id == active_round.id,
                             AIMessage.role.in_([AIMessageRole.user, AIMessageRole.assistant]),
@@ -405,8 +410,8 @@ def _start_chat_ai(story_id: int, user_message: str, orch: Orchestrator,
                         .order_by(AIMessage.created_at)
                     )
                     history = [
-                        {"role": m.role.value, "content": m.content}
-                        for m in msg_result.scalars().all()
+                        {"role": role.value, "content": content}
+                        for role, content in msg_result.all()
                     ]
 
                     registry = await _build_project_registry(
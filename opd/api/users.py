@@ -13,9 +13,13 @@ from opd.db.models import User
 router = APIRouter()
 
 
+_USERNAME_RE = re.compile(r"^[a-zA-Z0-9_]+$")
+
+
 class RegisterRequest(BaseModel):
     """用户注册请求"""
 
+    # Length limits are enforced by Field before the validators below run
     username: str = Field(..., min_length=3, max_length=20)
     email: EmailStr
     password: str = Field(..., min_length=8)
@@ -24,7 +28,7 @@ class RegisterRequest(BaseModel):
     @classmethod
     def validate_username(cls, v: str) -> str:
         """验证用户名格式"""
-        if not re.match(r"^[a-zA-Z0-9_]{3,20}$", v):
+        if not _USERNAME_RE.match(v):
             raise ValueError("用户名长度为 3-20 字符，仅支持字母、数字、下划线")
         return v
 
@@ -32,8 +36,6 @@ class RegisterRequest(BaseModel):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """验证密码强度"""
-        if len(v) < 8:
-            raise ValueError("密码长度至少为 8 字符")
         if not re.search(r"[A-Z]", v):
             raise ValueError("密码必须包含大写字母")
         if not re.search(r"[a-z]", v):
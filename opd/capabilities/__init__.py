@@ -1,6 +1,19 @@
-"""Capabilities package."""
+"""Capabilities package.
+
+The registry is resolved lazily (PEP 562) so that provider modules importing
+``opd.capabilities.base`` don't pull in the registry and config loader.
+"""
 
 from opd.capabilities.base import Capability, HealthStatus, Provider
-from opd.capabilities.registry import CapabilityRegistry, PreflightResult
 
 __all__ = ["Capability", "CapabilityRegistry", "HealthStatus", "PreflightResult", "Provider"]
+
+_LAZY_EXPORTS = {"CapabilityRegistry", "PreflightResult"}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        from opd.capabilities import registry
+
+        return getattr(registry, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
-import importlib
+import asyncio
+import json
 import logging
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from opd.capabilities.base import Capability, HealthStatus, Provider
-from opd.config import CapabilityConfig
+from opd.capabilities.base import Capability, HealthStatus
+
+if TYPE_CHECKING:
+    from opd.capabilities.base import Provider
+    from opd.config import CapabilityConfig
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached override instances; least recently used ones are retired
+# and cleaned up once no registry still uses them
+_MAX_CACHED_INSTANCES = 32
+
 # Built-in provider implementations (lazy-imported on first use)
 _BUILTIN_PROVIDERS: dict[str, dict[str, str]] = {
     "ai": {
@@ -73,11 +84,18 @@ _PROVIDER_LABELS: dict[str, str] = {
 
 def _import_provider(dotted_path: str) -> type[Provider]:
     """Import a provider class from a dotted path like 'module.path:ClassName'."""
+    import importlib
+
     module_path, class_name = dotted_path.rsplit(":", 1)
     module = importlib.import_module(module_path)
     return getattr(module, class_name)
 
 
+def _instance_key(category: str, provider_name: str, config: dict) -> tuple[str, str, str]:
+    """Cache key for a provider instance: identical config → identical key."""
+    return category, provider_name, json.dumps(config or {}, sort_keys=True, default=str)
+
+
 @dataclass
 class PreflightResult:
     """Result of a preflight capability check before stage execution."""
@@ -126,17 +144,81 @@ class CapabilityRegistry:
     def __init__(self):
         self._capabilities: dict[str, Capability] = {}
         self._external_providers: dict[str, dict[str, type[Provider]]] = {}
+        # Initialized providers keyed by (category, provider, config JSON), in LRU order
+        self._instance_cache: OrderedDict[tuple[str, str, str], Provider] = OrderedDict()
+        # Instances dropped from the cache whose cleanup() is still pending
+        self._retired: list[Provider] = []
+        # Live registries sharing this cache (this one and its override copies)
+        self._registries: weakref.WeakSet[CapabilityRegistry] = weakref.WeakSet([self])
+        # Provider catalog (category → provider entries) built by list_available()
+        self._catalog: list[tuple[str, list[dict]]] | None = None
 
     def register_provider(self, category: str, name: str, cls: type[Provider]):
         """Register an external provider implementation."""
         self._external_providers.setdefault(category, {})[name] = cls
+        self._catalog = None
+        for key in [k for k in self._instance_cache if k[:2] == (category, name)]:
+            self._retired.append(self._instance_cache.pop(key))
+
+    async def create(self, category: str, provider_name: str,
+                     config: dict) -> Provider | None:
+        """Return an initialized provider, reusing a cached instance for identical config.
+
+        Avoids re-running ``initialize()`` (which may probe the network) when the
+        same provider/config is requested repeatedly, e.g. per-request project
+        overrides. Use ``create_fresh()`` when a new instance is required. At most
+        ``_MAX_CACHED_INSTANCES`` are kept; evicted ones are cleaned up once no
+        registry's capabilities hold them.
+        """
+        await self._cleanup_retired()
+        key = _instance_key(category, provider_name, config)
+        cached = self._instance_cache.get(key)
+        if cached is not None:
+            self._instance_cache.move_to_end(key)
+            return cached
+        provider = await self.create_fresh(category, provider_name, config)
+        if provider:
+            self._instance_cache[key] = provider
+            while len(self._instance_cache) > _MAX_CACHED_INSTANCES:
+                self._retired.append(self._instance_cache.popitem(last=False)[1])
+            await self._cleanup_retired()
+        return provider
+
+    def _in_use(self, provider: Provider) -> bool:
+        """Whether a live registry sharing the cache still serves this instance."""
+        return any(
+            cap.provider is provider
+            for reg in list(self._registries) for cap in reg._capabilities.values()
+        )
+
+    async def _cleanup_retired(self):
+        """Await cleanup() of evicted instances that no registry uses anymore."""
+        in_use: list[Provider] = []
+        idle: list[Provider] = []
+        for provider in self._retired:
+            (in_use if self._in_use(provider) else idle).append(provider)
+        self._retired[:] = in_use
+        for provider in idle:
+            try:
+                await provider.cleanup()
+            except Exception as e:
+                logger.error("Error cleaning up evicted provider [%s]: %s",
+                             type(provider).__name__, e)
+
+    async def create_fresh(self, category: str, provider_name: str,
+                           config: dict) -> Provider | None:
+        """Create and initialize a new provider instance, bypassing the cache."""
+        provider = self._create_provider(category, provider_name, config)
+        if provider:
+            await provider.initialize()
+        return provider
 
     async def initialize_from_config(self, configs: dict[str, CapabilityConfig]):
         """Create and initialize capabilities from global config."""
         for cap_name, cap_config in configs.items():
-            provider = self._create_provider(cap_name, cap_config.provider, cap_config.config)
+            # Global providers live in _capabilities, outside the evictable cache
+            provider = await self.create_fresh(cap_name, cap_config.provider, cap_config.config)
             if provider:
-                await provider.initialize()
                 self._capabilities[cap_name] = Capability(cap_name, provider)
                 logger.info("Capability [%s] initialized with provider [%s]", cap_name,
                             cap_config.provider)
@@ -168,53 +250,92 @@ class CapabilityRegistry:
         """Get a capability by name."""
         return self._capabilities.get(name)
 
+    @staticmethod
+    async def _gather_health(caps: list[Capability]) -> list[HealthStatus]:
+        """Run health checks concurrently; a raising check counts as unhealthy."""
+        results = await asyncio.gather(
+            *(cap.health_check() for cap in caps), return_exceptions=True,
+        )
+        return [
+            HealthStatus(healthy=False, message=str(r) or type(r).__name__)
+            if isinstance(r, BaseException) else r
+            for r in results
+        ]
+
     async def check_health(self, cap_names: list[str]) -> dict[str, HealthStatus]:
         """Check health of multiple capabilities."""
+        configured = [name for name in cap_names if name in self._capabilities]
+        statuses = await self._gather_health([self._capabilities[n] for n in configured])
+        checked = dict(zip(configured, statuses))
         results = {}
         for name in cap_names:
-            cap = self._capabilities.get(name)
-            if cap:
-                results[name] = await cap.health_check()
+            if name in checked:
+                results[name] = checked[name]
             else:
                 results[name] = HealthStatus(healthy=False, message=f"Capability [{name}] not configured")
         return results
 
     async def preflight(self, required: list[str],
                         optional: list[str] | None = None) -> PreflightResult:
-        """Run preflight checks for a stage's capability requirements."""
+        """Run preflight checks for a stage's capability requirements.
+
+        Health checks of all configured capabilities run concurrently, so the
+        latency is that of the slowest provider rather than the sum.
+        """
         result = PreflightResult()
+        optional = optional or []
+        health = await self.check_health(
+            [n for n in dict.fromkeys([*required, *optional]) if n in self._capabilities]
+        )
 
         for name in required:
-            cap = self._capabilities.get(name)
-            if not cap:
-                result.add_error(f"能力 [{name}] 未配��")
+            if name not in health:
+                result.add_error(f"能力 [{name}] 未配置")
                 continue
-            health = await cap.health_check()
-            if not health.healthy:
-                result.add_error(f"能力 [{name}] 不可用: {health.message}")
+            if not health[name].healthy:
+                result.add_error(f"能力 [{name}] 不可用: {health[name].message}")
 
-        for name in (optional or []):
-            cap = self._capabilities.get(name)
-            if cap:
-                health = await cap.health_check()
-                if not health.healthy:
-                    result.add_warning(f"能力 [{name}] 不可用，将降级处理: {health.message}")
+        for name in optional:
+            if name in health and not health[name].healthy:
+                result.add_warning(f"能力 [{name}] 不可用，将降级处理: {health[name].message}")
 
         return result
 
     async def cleanup(self):
         """Cleanup all providers on shutdown."""
+        cleaned: set[int] = set()
         for cap in self._capabilities.values():
+            cleaned.add(id(cap.provider))
             try:
                 await cap.provider.cleanup()
             except Exception as e:
                 logger.error("Error cleaning up capability [%s]: %s", cap.name, e)
+        for (category, provider_name, _), provider in self._instance_cache.items():
+            if id(provider) in cleaned:
+                continue
+            cleaned.add(id(provider))
+            try:
+                await provider.cleanup()
+            except Exception as e:
+                logger.error("Error cleaning up provider [%s/%s]: %s", category, provider_name, e)
+        self._instance_cache.clear()
+        for provider in self._retired:
+            if id(provider) in cleaned:
+                continue
+            cleaned.add(id(provider))
+            try:
+                await provider.cleanup()
+            except Exception as e:
+                logger.error("Error cleaning up evicted provider [%s]: %s",
+                             type(provider).__name__, e)
+        self._retired.clear()
 
     # --- Project-level overrides ---
 
-    def list_available(self) -> list[dict]:
-        """Return all capability categories, their available providers, and CONFIG_SCHEMA."""
-        result = []
+    def _provider_catalog(self) -> list[tuple[str, list[dict]]]:
+        """Categories with their provider entries; cached until register_provider()."""
+        if self._catalog is not None:
+            return self._catalog
         all_categories: dict[str, dict[str, str]] = {}
         # Merge built-in and external providers
         for cat, providers in _BUILTIN_PROVIDERS.items():
@@ -223,6 +344,7 @@ class CapabilityRegistry:
             for pname, cls in providers.items():
                 all_categories.setdefault(cat, {})[pname] = cls
 
+        catalog = []
         for category, providers in all_categories.items():
             provider_list = []
             for pname, dotted_or_cls in providers.items():
@@ -240,12 +362,20 @@ class CapabilityRegistry:
                     "label": _PROVIDER_LABELS.get(pname, pname),
                     "config_schema": schema,
                 })
+            catalog.append((category, provider_list))
+        self._catalog = catalog
+        return catalog
+
+    def list_available(self) -> list[dict]:
+        """Return all capability categories, their available providers, and CONFIG_SCHEMA."""
+        result = []
+        for category, provider_list in self._provider_catalog():
             # Current active provider for this category
             active_cap = self._capabilities.get(category)
             result.append({
                 "capability": category,
                 "label": _CAPABILITY_LABELS.get(category, category),
-                "providers": provider_list,
+                "providers": list(provider_list),
                 "active_provider": (
                     type(active_cap.provider).__name__ if active_cap else None
                 ),
@@ -270,6 +400,11 @@ class CapabilityRegistry:
         new_reg._external_providers = {
             cat: dict(providers) for cat, providers in self._external_providers.items()
         }
+        # Share initialized instances so repeated overrides reuse providers
+        new_reg._instance_cache = self._instance_cache
+        new_reg._retired = self._retired
+        new_reg._registries = self._registries
+        self._registries.add(new_reg)
         # Start with a copy of current capabilities
         # Note: Capabilities are recreated below with new provider instances,
         # so shallow copy is sufficient here
@@ -307,16 +442,15 @@ class CapabilityRegistry:
                         )
                         continue
                     merged = dict(config_override)
-                provider = self._create_provider(cap_name, provider_name, merged)
+                provider = await self.create(cap_name, provider_name, merged)
             else:
                 # Use the overridden provider with merged config
                 existing = self._capabilities.get(cap_name)
                 base_config = existing.provider.config if existing else {}
                 merged = {**base_config, **config_override}
-                provider = self._create_provider(cap_name, provider_name, merged)
+                provider = await self.create(cap_name, provider_name, merged)
 
             if provider:
-                await provider.initialize()
                 new_reg._capabilities[cap_name] = Capability(cap_name, provider)
 
         return new_reg
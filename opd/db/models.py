@@ -249,7 +249,9 @@ class Story(Base):
     active_round: Mapped[Round | None] = relationship(
         foreign_keys=[active_round_id], lazy="joined"
     )
-    tasks: Mapped[list[Task]] = relationship(back_populates="story", cascade="all, delete-orphan")
+    tasks: Mapped[list[Task]] = relationship(
+        back_populates="story", cascade="all, delete-orphan", order_by="Task.order"
+    )
     rounds: Mapped[list[Round]] = relationship(
         foreign_keys="Round.story_id", back_populates="story", cascade="all, delete-orphan"
     )
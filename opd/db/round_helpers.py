@@ -4,13 +4,25 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import update
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 if TYPE_CHECKING:
     from opd.db.models import Round, Story
 
 
+async def get_active_round(db: AsyncSession, story_id: int) -> Round | None:
+    """Fetch a story's active round without loading its other rounds."""
+    from opd.db.models import Round, RoundStatus
+    result = await db.execute(
+        select(Round)
+        .where(Round.story_id == story_id, Round.status == RoundStatus.active)
+        .order_by(Round.round_number.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
 async def set_active_round(db: AsyncSession, story: Story, round: Round) -> None:
     """Set the active round for a story.
 
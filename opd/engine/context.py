@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import re
+import stat
 from typing import TYPE_CHECKING
 
 from opd.engine.workspace import read_doc, resolve_work_dir
@@ -80,67 +81,88 @@ _CORRUPTED_PATTERNS = (
 )
 
 
+# CLAUDE.md path → (mtime_ns, size, section) of the last version read; an edit
+# replaces the entry, so stale versions are not kept alive.
+_claude_md_cache: dict[str, tuple[int, int, str]] = {}
+
+
 def _read_claude_md(project: Project) -> str:
     """Read CLAUDE.md from the project workspace root, if it exists.
 
-    Uses chunked reading for files larger than 10MB to avoid memory issues.
+    The parsed section is cached per path and reused while mtime and size are
+    unchanged, so repeated prompt builds skip the read and validation.
     """
     try:
-        work_dir = resolve_work_dir(project)
-        claude_md = work_dir / "CLAUDE.md"
-        if not claude_md.is_file():
+        claude_md = resolve_work_dir(project) / "CLAUDE.md"
+        try:
+            st = claude_md.stat()
+        except FileNotFoundError:
             return ""
-
-        # Check file size
-        file_size = claude_md.stat().st_size
-        max_size = 10 * 1024 * 1024  # 10MB
-
-        # Read file content (chunked if large)
-        if file_size <= max_size:
-            # Small file: read directly
-            content = claude_md.read_text(encoding="utf-8").strip()
-        else:
-            # Large file: read in chunks
-            logger.info(
-                "CLAUDE.md for project %s is large (%.2f MB), using chunked read",
-                project.id, file_size / (1024 * 1024)
-            )
-            chunks = []
-            chunk_size = 1024 * 1024  # 1MB chunks
-            with open(claude_md, "r", encoding="utf-8") as f:
-                while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
-                        break
-                    chunks.append(chunk)
-            content = "".join(chunks).strip()
-
-        if not content:
+        if not stat.S_ISREG(st.st_mode):
             return ""
+        path = str(claude_md)
+        cached = _claude_md_cache.get(path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        section = _claude_md_section(path, st.st_size, project.id)
+        _claude_md_cache[path] = (st.st_mtime_ns, st.st_size, section)
+        return section
+    except Exception:
+        logger.debug("Failed to read CLAUDE.md for project %s", project.id, exc_info=True)
+    return ""
+
+
+def _claude_md_section(path: str, file_size: int, project_id: int) -> str:
+    """Load and validate CLAUDE.md.
+
+    Uses chunked reading for files larger than 10MB to avoid memory issues.
+    """
+    max_size = 10 * 1024 * 1024  # 10MB
+
+    # Read file content (chunked if large)
+    if file_size <= max_size:
+        # Small file: read directly
+        with open(path, encoding="utf-8") as f:
+            content = f.read().strip()
+    else:
+        # Large file: read in chunks
+        logger.info(
+            "CLAUDE.md for project %s is large (%.2f MB), using chunked read",
+            project_id, file_size / (1024 * 1024)
+        )
+        chunks = []
+        chunk_size = 1024 * 1024  # 1MB chunks
+        with open(path, "r", encoding="utf-8") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        content = "".join(chunks).strip()
 
-        # Validate: first non-empty line should be a markdown header
-        first_line = content.lstrip().split("\n", 1)[0].strip()
-        if not first_line.startswith("#"):
+    if not content:
+        return ""
+
+    # Validate: first non-empty line should be a markdown header
+    first_line = content.lstrip().split("\n", 1)[0].strip()
+    if not first_line.startswith("#"):
+        logger.warning(
+            "CLAUDE.md for project %s does not start with a markdown header, skipping",
+            project_id,
+        )
+        return ""
+
+    # Check for AI conversation artifacts
+    head = content[:500]
+    for pattern in _CORRUPTED_PATTERNS:
+        if pattern in head:
             logger.warning(
-                "CLAUDE.md for project %s does not start with a markdown header, skipping",
-                project.id,
+                "CLAUDE.md for project %s appears corrupted (found '%s'), skipping",
+                project_id, pattern,
             )
             return ""
 
-        # Check for AI conversation artifacts
-        head = content[:500]
-        for pattern in _CORRUPTED_PATTERNS:
-            if pattern in head:
-                logger.warning(
-                    "CLAUDE.md for project %s appears corrupted (found '%s'), skipping",
-                    project.id, pattern,
-                )
-                return ""
-
-        return f"## 项目上下文 (CLAUDE.md)\n{content}"
-    except Exception:
-        logger.debug("Failed to read CLAUDE.md for project %s", project.id, exc_info=True)
-    return ""
+    return f"## 项目上下文 (CLAUDE.md)\n{content}"
 
 
 def build_project_context(project: Project, include_work_dir: bool = False) -> str:
@@ -219,13 +241,13 @@ def build_clarifying_prompt(
         "以 JSON 数组格式输出：[{\"question\": \"...\"}]\n\n"
         + build_project_context(project, include_work_dir=True)
     )
-    user = f"## PRD\n{_resolve_doc(story, project, 'prd', 'prd.md')}"
+    parts = [f"## PRD\n{_resolve_doc(story, project, 'prd', 'prd.md')}"]
     clarifications = _clarifications_block(story)
     if clarifications:
-        user += f"\n\n{clarifications}"
+        parts.append(clarifications)
     if source_context:
-        user += f"\n\n{source_context}"
-    return system, user
+        parts.append(source_context)
+    return system, "\n\n".join(parts)
 
 
 def build_planning_prompt(story: Story, project: Project) -> tuple[str, str]:
@@ -265,16 +287,17 @@ def build_coding_prompt(story: Story, project: Project, round_: Round) -> tuple[
         "编码完成后，请输出一段总结，包括：改动概述、如何运行和测试、注意事项。\n\n"
         + build_project_context(project, include_work_dir=True)
     )
-    user = f"## 详细设计\n{_resolve_doc(story, project, 'detailed_design', 'detailed_design.md')}"
+    detailed_design = _resolve_doc(story, project, 'detailed_design', 'detailed_design.md')
+    parts = [f"## 详细设计\n{detailed_design}"]
     tasks = _tasks_block(story)
     if tasks:
-        user += f"\n\n{tasks}"
+        parts.append(tasks)
     # Add round context for iterate/restart
     if round_.type.value == "iterate" and round_.close_reason:
-        user += f"\n\n## 上一轮 Review 意见\n{round_.close_reason}\n请根据以上意见修改代码。"
+        parts.append(f"## 上一轮 Review 意见\n{round_.close_reason}\n请根据以上意见修改代码。")
     elif round_.type.value == "restart" and round_.close_reason:
-        user += f"\n\n## 上一轮失败原因\n{round_.close_reason}\n请避免重蹈覆辙。"
-    return system, user
+        parts.append(f"## 上一轮失败原因\n{round_.close_reason}\n请避免重蹈覆辙。")
+    return system, "\n\n".join(parts)
 
 
 def build_light_coding_prompt(story: Story, project: Project, round_: Round) -> tuple[str, str]:
@@ -285,10 +308,10 @@ def build_light_coding_prompt(story: Story, project: Project, round_: Round) ->
         "编码完成后，请输出一段总结，包括：改动概述、如何运行和测试、注意事项。\n\n"
         + build_project_context(project, include_work_dir=True)
     )
-    user = f"## 编码指引\n{_resolve_doc(story, project, 'prd', 'prd.md')}"
+    parts = [f"## 编码指引\n{_resolve_doc(story, project, 'prd', 'prd.md')}"]
     if round_.type.value == "iterate" and round_.close_reason:
-        user += f"\n\n## 上一轮 Review 意见\n{round_.close_reason}\n请根据以上意见修改代码。"
-    return system, user
+        parts.append(f"## 上一轮 Review 意见\n{round_.close_reason}\n请根据以上意见修改代码。")
+    return system, "\n\n".join(parts)
 
 
 def build_continuation_prompt(output_so_far: str, tail_chars: int = 500) -> str:
@@ -441,22 +464,27 @@ def build_designing_chat_prompt(
     return system, "\n\n".join(parts)
 
 
+_DISCUSSION_RE = re.compile(r"<discussion>(.*?)</discussion>", re.DOTALL)
+_UPDATED_BLOCK_RE = re.compile(r"<updated_(?:doc|prd)>.*?</updated_(?:doc|prd)>", re.DOTALL)
+_UPDATED_DOC_RE = re.compile(r"<updated_doc>(.*?)</updated_doc>", re.DOTALL)
+_UPDATED_PRD_RE = re.compile(r"<updated_prd>(.*?)</updated_prd>", re.DOTALL)
+_SENTENCE_END_RE = re.compile(r"(?<=[。！？.!?])\s*")
+
+
 def parse_refine_response(full_text: str) -> tuple[str, str | None]:
     """Parse AI refinement response into (discussion, updated_doc_or_none)."""
     discussion = ""
     updated_doc = None
 
-    disc_match = re.search(r"<discussion>(.*?)</discussion>", full_text, re.DOTALL)
+    disc_match = _DISCUSSION_RE.search(full_text)
     if disc_match:
         discussion = disc_match.group(1).strip()
     else:
         # Fallback: strip updated_doc blocks, take remaining as discussion
-        discussion = re.sub(
-            r"<updated_(?:doc|prd)>.*?</updated_(?:doc|prd)>", "", full_text, flags=re.DOTALL,
-        ).strip()
+        discussion = _UPDATED_BLOCK_RE.sub("", full_text).strip()
         # Safety: if no tags were used and discussion is too long, truncate to first few sentences
         if len(discussion) > 500:
-            sentences = re.split(r'(?<=[。！？.!?])\s*', discussion)
+            sentences = _SENTENCE_END_RE.split(discussion)
             truncated = ""
             for s in sentences[:3]:
                 truncated += s
@@ -465,9 +493,7 @@ def parse_refine_response(full_text: str) -> tuple[str, str | None]:
             discussion = truncated.strip() if truncated.strip() else discussion[:300] + "..."
 
     # Support both <updated_doc> (new) and <updated_prd> (legacy)
-    doc_match = re.search(r"<updated_doc>(.*?)</updated_doc>", full_text, re.DOTALL)
-    if not doc_match:
-        doc_match = re.search(r"<updated_prd>(.*?)</updated_prd>", full_text, re.DOTALL)
+    doc_match = _UPDATED_DOC_RE.search(full_text) or _UPDATED_PRD_RE.search(full_text)
     if doc_match:
         updated_doc = doc_match.group(1).strip()
 
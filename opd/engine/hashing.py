@@ -9,8 +9,8 @@ from opd.engine.workspace import read_doc
 
 
 def compute_hash(content: str) -> str:
-    """Compute SHA-256 hex digest of content."""
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    """Compute SHA-256 hex digest of content (change detection, not security)."""
+    return hashlib.sha256(content.encode("utf-8"), usedforsecurity=False).hexdigest()
 
 
 # Stage → (input doc field on Story, input doc filename, hash field on Story, output doc field)
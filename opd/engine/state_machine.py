@@ -23,6 +23,11 @@ VALID_TRANSITIONS: dict[str, list[str]] = {
     ],
 }
 
+# Same table as frozensets for O(1) membership checks in can_transition()
+_VALID_SET: dict[str, frozenset[str]] = {
+    src: frozenset(dsts) for src, dsts in VALID_TRANSITIONS.items()
+}
+
 ROLLBACK_ACTIONS: dict[tuple[str, str], str] = {
     (StoryStatus.verifying, StoryStatus.coding): "iterate",
     (StoryStatus.verifying, StoryStatus.designing): "restart",
@@ -62,7 +67,7 @@ class StateMachine:
     """Validates and executes Story status transitions."""
 
     def can_transition(self, from_status: str, to_status: str) -> bool:
-        return to_status in VALID_TRANSITIONS.get(from_status, [])
+        return to_status in _VALID_SET.get(from_status, frozenset())
 
     def transition(self, story, to_status: str) -> str | None:
         """Transition a story to a new status. Returns rollback action if applicable."""
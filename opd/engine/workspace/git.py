@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 from opd.engine.workspace.paths import resolve_work_dir
+from opd.utils.git import inject_token
 
 logger = logging.getLogger(__name__)
 
@@ -19,13 +20,6 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-def _inject_token(repo_url: str, token: str | None) -> str:
-    """Inject auth token into HTTPS git URLs."""
-    if token and repo_url.startswith("https://"):
-        return repo_url.replace("https://", f"https://x-access-token:{token}@")
-    return repo_url
-
-
 @functools.lru_cache(maxsize=1)
 def _detect_proxy() -> tuple[tuple[str, str], ...]:
     """Detect system HTTPS proxy and return env dict for subprocess."""
@@ -113,7 +107,7 @@ async def clone_workspace(
     If token is provided, injects it into HTTPS URLs for authentication.
     """
     work_dir = resolve_work_dir(project)
-    auth_url = _inject_token(repo_url, token)
+    auth_url = inject_token(repo_url, token)
     proxy_env = dict(_detect_proxy())
     import os
     sub_env = {**os.environ, **proxy_env} if proxy_env else None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 import subprocess
@@ -24,11 +25,20 @@ DOC_FIELD_MAP: dict[str, str] = {
 DOC_FILENAME_MAP: dict[str, str] = {v: k for k, v in DOC_FIELD_MAP.items()}
 
 
+_UNSAFE_CHARS_RE = re.compile(r"[^\w\s-]")
+_SEPARATORS_RE = re.compile(r"[\s_]+")
+
+
+@functools.lru_cache(maxsize=256)
 def _sanitize(name: str) -> str:
-    """Sanitize a string for use as a directory name."""
+    """Sanitize a string for use as a directory name.
+
+    Memoized: every workspace/doc path resolution re-sanitizes the same
+    handful of project names and story titles.
+    """
     name = unicodedata.normalize("NFKD", name)
-    name = re.sub(r"[^\w\s-]", "", name.lower())
-    return re.sub(r"[\s_]+", "-", name).strip("-")[:80]
+    name = _UNSAFE_CHARS_RE.sub("", name.lower())
+    return _SEPARATORS_RE.sub("-", name).strip("-")[:80]
 
 
 def resolve_work_dir(project: Any) -> Path:
@@ -73,6 +83,9 @@ def write_doc(project: Any, story: Any, filename: str, content: str) -> str:
     return story_docs_relpath(story, filename)
 
 
+_ROUND_SUFFIX_RE = re.compile(r"-r(\d+)$")
+
+
 def _story_branches(work_dir: Path, story_id: int) -> list[str]:
     """Return local opd branches for a story, sorted by round number descending.
 
@@ -89,7 +102,7 @@ def _story_branches(work_dir: Path, story_id: int) -> list[str]:
         branches = [b.strip().lstrip("* ") for b in result.stdout.splitlines() if b.strip()]
 
         def _round_num(name: str) -> int:
-            m = re.search(r"-r(\d+)$", name)
+            m = _ROUND_SUFFIX_RE.search(name)
             return int(m.group(1)) if m else 0
 
         branches.sort(key=_round_num, reverse=True)
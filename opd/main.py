@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import argparse
 import logging
+import logging.handlers
+import queue
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -42,20 +44,39 @@ def get_orchestrator() -> Orchestrator:
     return _orchestrator
 
 
-def _setup_logging(config):
+def _setup_logging(
+    config,
+) -> tuple[logging.handlers.QueueHandler, logging.handlers.QueueListener] | None:
+    """Route root logging through a queue so stdout/file writes happen off the event loop.
+
+    Returns the root QueueHandler and its started listener (None if logging was
+    already configured). On shutdown remove the handler, then stop the listener
+    to flush pending records.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+
     log_dir = Path(config.logging.dir)
     log_dir.mkdir(parents=True, exist_ok=True)
 
-    logging.basicConfig(
-        level=getattr(logging, config.logging.level.upper(), logging.INFO),
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.handlers.RotatingFileHandler(
-                log_dir / "opd.log", maxBytes=10_000_000, backupCount=5
-            ),
-        ],
-    )
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    handlers = [
+        logging.StreamHandler(sys.stdout),
+        logging.handlers.RotatingFileHandler(
+            log_dir / "opd.log", maxBytes=10_000_000, backupCount=5
+        ),
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    root.setLevel(getattr(logging, config.logging.level.upper(), logging.INFO))
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    root.addHandler(queue_handler)
+    return queue_handler, listener
 
 
 @asynccontextmanager
@@ -64,7 +85,7 @@ async def lifespan(app: FastAPI):
     global _orchestrator
 
     config = app.state.config
-    _setup_logging(config)
+    log_handles = _setup_logging(config)
     logger.info("Starting OPD v2...")
 
     # Database
@@ -96,6 +117,11 @@ async def lifespan(app: FastAPI):
     await registry.cleanup()
     await close_db()
     logger.info("OPD shutdown complete")
+    if log_handles:
+        queue_handler, listener = log_handles
+        # Detach first so nothing is queued after the listener stops reading
+        logging.getLogger().removeHandler(queue_handler)
+        listener.stop()
 
 
 def create_app(config_path: str = "opd.yaml") -> FastAPI:
@@ -0,0 +1 @@
+"""Shared helpers used across the engine and providers."""
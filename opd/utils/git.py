@@ -0,0 +1,16 @@
+"""Git URL helpers shared by the workspace engine and SCM providers."""
+
+from __future__ import annotations
+
+from urllib.parse import urlsplit
+
+
+def inject_token(repo_url: str, token: str | None) -> str:
+    """Inject auth token into HTTPS git URLs, replacing any existing userinfo."""
+    if not token:
+        return repo_url
+    parts = urlsplit(repo_url)
+    if parts.scheme != "https":
+        return repo_url
+    host = parts.netloc.rpartition("@")[2]  # keeps :port and [IPv6] intact
+    return parts._replace(netloc=f"x-access-token:{token}@{host}").geturl()
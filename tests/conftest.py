@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from types import SimpleNamespace
+import asyncio
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from opd.api.deps import get_db, get_orch
 from opd.capabilities.base import Capability, HealthStatus, Provider
@@ -46,12 +48,56 @@ class UnhealthyProvider(Provider):
         return HealthStatus(healthy=False, message="connection refused")
 
 
+# --- Test doubles ---
+
+
+class _Double:
+    """Plain attribute bag; subclasses list their fields in ``__slots__``.
+
+    Slots make a typo'd attribute an AttributeError instead of a silent new field.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+class _Project(_Double):
+    __slots__ = ("architecture", "description", "id", "name", "repo_url", "tech_stack")
+
+
+class _Story(_Double):
+    __slots__ = (
+        "coding_input_hash",
+        "coding_report",
+        "confirmed_prd",
+        "current_round",
+        "designing_input_hash",
+        "detailed_design",
+        "feature_tag",
+        "id",
+        "planning_input_hash",
+        "prd",
+        "project_id",
+        "raw_input",
+        "status",
+        "technical_design",
+        "title",
+    )
+
+
+class _Round(_Double):
+    __slots__ = ("branch_name", "id", "round_number", "status", "story_id", "type")
+
+
 # --- Fixtures ---
 
 
 @pytest.fixture
 def mock_project():
-    return SimpleNamespace(
+    return _Project(
         id=1, name="test-project", repo_url="https://github.com/test/repo",
         description="Test project", tech_stack="Python", architecture="monolith",
     )
@@ -59,7 +105,7 @@ def mock_project():
 
 @pytest.fixture
 def mock_story():
-    return SimpleNamespace(
+    return _Story(
         id=1, project_id=1, title="Test story", raw_input="Build a login page",
         status=StoryStatus.preparing, current_round=1,
         prd=None, confirmed_prd=None, technical_design=None, detailed_design=None,
@@ -69,7 +115,7 @@ def mock_story():
 
 @pytest.fixture
 def mock_round():
-    return SimpleNamespace(
+    return _Round(
         id=1, story_id=1, round_number=1, type=RoundType.initial,
         status=RoundStatus.active, branch_name="",
     )
@@ -96,45 +142,106 @@ def orchestrator(capability_registry):
     return Orchestrator(stages=stages, state_machine=sm, capabilities=capability_registry)
 
 
+@pytest.fixture(scope="session")
+def db_engine():
+    """In-memory SQLite engine with the schema created once per session.
+
+    StaticPool keeps the single in-memory connection alive across tests;
+    tests get isolation from the per-test rollback in ``db_connection``.
+    Under pytest-xdist each worker process gets its own in-memory database.
+    """
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN itself (see the SQLAlchemy SQLite dialect docs).
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_pysqlite_autobegin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async def _create_schema():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(_create_schema())
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+async def db_connection(db_engine):
+    """Connection in an outer transaction that is rolled back after the test."""
+    async with db_engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            yield conn
+        finally:
+            await trans.rollback()
+
+
+@pytest.fixture
+def db_session_factory(db_connection):
+    """Session factory whose sessions commit to SAVEPOINTs inside the test transaction."""
+    return async_sessionmaker(
+        bind=db_connection, expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
 @pytest.fixture
-async def db_session():
-    """In-memory SQLite session for testing."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    session_factory = async_sessionmaker(engine, expire_on_commit=False)
-    async with session_factory() as session:
+async def db_session(db_session_factory):
+    """In-memory SQLite session for testing; all writes are rolled back afterwards."""
+    async with db_session_factory() as session:
         async with session.begin():
             yield session
-    await engine.dispose()
 
 
-@pytest.fixture
-async def app_client():
-    """Create a test app with in-memory DB."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+@pytest.fixture(scope="session")
+def test_app():
+    """FastAPI app built once per session (router/schema setup is the slow part)."""
+    return create_app()
+
 
-    session_factory = async_sessionmaker(engine, expire_on_commit=False)
-    app = create_app()
+@pytest.fixture(scope="session")
+def test_transport(test_app):
+    """ASGI transport for the shared app (stateless, so safe to reuse)."""
+    return ASGITransport(app=test_app)
+
+
+@pytest.fixture(scope="session")
+def app_capabilities():
+    """Stage handlers and mock AI registry for app tests (pure configuration)."""
+    registry = CapabilityRegistry()
+    registry._capabilities["ai"] = Capability("ai", MockAIProvider())
+    return {StoryStatus.preparing.value: PreparingStage()}, registry
+
+
+@pytest.fixture
+async def app_client(test_app, test_transport, db_session_factory, app_capabilities):
+    """Client for the shared test app; DB writes are rolled back after each test."""
+    app = test_app
 
     async def override_get_db():
-        async with session_factory() as session:
+        async with db_session_factory() as session:
             async with session.begin():
                 yield session
 
-    registry = CapabilityRegistry()
-    registry._capabilities["ai"] = Capability("ai", MockAIProvider())
-    stages = {StoryStatus.preparing.value: PreparingStage()}
+    stages, registry = app_capabilities
+    # Per test: the orchestrator tracks running tasks and SSE subscribers
     orch = Orchestrator(stages=stages, state_machine=StateMachine(), capabilities=registry)
 
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_orch] = lambda: orch
     app.dependency_overrides[get_orchestrator] = lambda: orch
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
+    async with AsyncClient(transport=test_transport, base_url="http://test") as client:
         yield client
 
-    await engine.dispose()
+    app.dependency_overrides.clear()
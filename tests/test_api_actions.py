@@ -10,6 +10,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from opd.db.models import (
+    AIMessage,
+    AIMessageRole,
     Base,
     Clarification,
     PRStatus,
@@ -127,6 +129,25 @@ class TestRollbackStory:
                 )
                 assert len(result.scalars().all()) == 0
 
+    async def test_rollback_clears_active_round_messages(self, action_db):
+        from opd.api.stories_actions import rollback_story
+        from opd.models.schemas import RollbackRequest
+
+        async with action_db() as db:
+            async with db.begin():
+                db.add_all([
+                    AIMessage(round_id=1, role=AIMessageRole.assistant, content=f"m{i}")
+                    for i in range(3)
+                ])
+        async with action_db() as db:
+            async with db.begin():
+                await rollback_story(
+                    1, RollbackRequest(target_stage="planning"), db, MagicMock(),
+                )
+        async with action_db() as db:
+            result = await db.execute(select(AIMessage).where(AIMessage.round_id == 1))
+            assert result.scalars().all() == []
+
     async def test_rollback_not_found(self, action_db):
         from fastapi import HTTPException
         from opd.api.stories_actions import rollback_story
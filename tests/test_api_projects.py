@@ -8,7 +8,7 @@ import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-from opd.db.models import Base, Project, ProjectCapabilityConfig, WorkspaceStatus
+from opd.db.models import Base, Project, ProjectCapabilityConfig, Story, WorkspaceStatus
 
 
 @pytest.fixture
@@ -56,6 +56,20 @@ class TestListProjects:
                 result = await list_projects(db)
                 assert len(result) == 1
                 assert result[0]["name"] == "test-proj"
+                assert result[0]["story_count"] == 0
+
+    async def test_list_counts_stories(self, project_db):
+        from opd.api.projects import list_projects
+
+        async with project_db() as db:
+            async with db.begin():
+                db.add_all([
+                    Story(project_id=1, title=f"s{i}", raw_input="x") for i in range(2)
+                ])
+            async with db.begin():
+                result = await list_projects(db)
+                assert result[0]["story_count"] == 2
+                assert result[0]["workspace_status"] == "ready"
 
 
 # ── get_project ──
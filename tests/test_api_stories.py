@@ -17,6 +17,7 @@ from opd.db.models import (
     RoundStatus,
     Story,
     StoryStatus,
+    Task,
     WorkspaceStatus,
 )
 
@@ -89,6 +90,19 @@ class TestGetStory:
                 assert "rounds" in result
                 assert "clarifications" in result
 
+    async def test_tasks_returned_in_order(self, story_db):
+        from opd.api.stories import get_story
+
+        orch = MagicMock()
+        orch.is_task_running.return_value = False
+        async with story_db() as db:
+            async with db.begin():
+                db.add_all([Task(story_id=1, title=t, order=o)
+                            for t, o in (("b", 2), ("a", 1), ("c", 3))])
+            async with db.begin():
+                result = await get_story(1, db, orch)
+                assert [t["title"] for t in result["tasks"]] == ["a", "b", "c"]
+
     async def test_get_not_found(self, story_db):
         from fastapi import HTTPException
         from opd.api.stories import get_story
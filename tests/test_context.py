@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
+import pytest
+
 from opd.db.models import RoundType
 from opd.engine.context import (
     COMPLETION_MARKER,
@@ -18,47 +20,57 @@ from opd.engine.context import (
     build_preparing_prompt,
     build_project_context,
     build_refine_prd_prompt,
+    _claude_md_cache,
+    _read_claude_md,
     is_output_complete,
     parse_refine_response,
     strip_completion_marker,
 )
 
 
+_PROJECT_DEFAULTS = dict(
+    id=1, name="test", repo_url="https://github.com/t/r",
+    description="A test project", tech_stack="Python", architecture="monolith",
+)
+
+
 def _project(**kw):
-    defaults = dict(
-        id=1, name="test", repo_url="https://github.com/t/r",
-        description="A test project", tech_stack="Python", architecture="monolith",
-        rules=[],
-    )
-    defaults.update(kw)
-    return SimpleNamespace(**defaults)
+    return SimpleNamespace(**{**_PROJECT_DEFAULTS, "rules": [], **kw})
+
+
+_STORY_DEFAULTS = dict(
+    id=1, title="Login", raw_input="Build login page",
+    prd="PRD content", confirmed_prd="Confirmed PRD",
+    technical_design="Tech design", detailed_design="Detailed design",
+    feature_tag=None,
+)
 
 
 def _story(**kw):
-    defaults = dict(
-        id=1, title="Login", raw_input="Build login page",
-        prd="PRD content", confirmed_prd="Confirmed PRD",
-        technical_design="Tech design", detailed_design="Detailed design",
-        feature_tag=None, tasks=[], clarifications=[],
-    )
-    defaults.update(kw)
-    return SimpleNamespace(**defaults)
+    return SimpleNamespace(**{**_STORY_DEFAULTS, "tasks": [], "clarifications": [], **kw})
+
+
+_ROUND_DEFAULTS = dict(
+    id=1, round_number=1, type=RoundType.initial,
+    close_reason=None,
+)
 
 
 def _round(**kw):
-    defaults = dict(
-        id=1, round_number=1, type=RoundType.initial,
-        close_reason=None,
-    )
-    defaults.update(kw)
-    return SimpleNamespace(**defaults)
+    return SimpleNamespace(**{**_ROUND_DEFAULTS, **kw})
+
+
+@pytest.fixture(scope="module")
+def project_context():
+    return build_project_context(_project())
 
 
 class TestBuildProjectContext:
-    def test_includes_project_info(self):
-        ctx = build_project_context(_project())
-        assert "test" in ctx
-        assert "Python" in ctx
+    @pytest.mark.parametrize("needle", [
+        "## 项目: test", "描述: A test project", "## 技术栈\nPython", "## 架构\nmonolith",
+    ])
+    def test_includes_project_info(self, project_context, needle):
+        assert needle in project_context
 
     def test_includes_rules(self):
         cat = SimpleNamespace(value="general")
@@ -68,6 +80,29 @@ class TestBuildProjectContext:
         assert "Rule 2" in ctx
 
 
+class TestReadClaudeMd:
+    def test_reads_and_picks_up_edits(self, tmp_path):
+        project = _project(workspace_dir=str(tmp_path))
+        md = tmp_path / "test" / "CLAUDE.md"
+        md.parent.mkdir()
+        md.write_text("# Repo\nv1")
+        assert _read_claude_md(project).endswith("# Repo\nv1")
+
+        md.write_text("# Repo\nversion 2")
+        assert _read_claude_md(project).endswith("# Repo\nversion 2")
+        # One entry per path, holding only the current version
+        assert _claude_md_cache[str(md)][2].endswith("# Repo\nversion 2")
+
+    def test_missing_or_invalid_is_empty(self, tmp_path):
+        project = _project(workspace_dir=str(tmp_path))
+        assert _read_claude_md(project) == ""
+
+        md = tmp_path / "test" / "CLAUDE.md"
+        md.parent.mkdir()
+        md.write_text("Let me read the repo first")
+        assert _read_claude_md(project) == ""
+
+
 class TestBuildPreparingPrompt:
     def test_returns_tuple(self):
         system, user = build_preparing_prompt(_story(), _project())
@@ -88,14 +123,20 @@ class TestBuildClarifyingPrompt:
         assert "src/main.py" in user
 
 
+@pytest.fixture(scope="module")
+def planning_prompts():
+    """Planning prompts for the default story/project, built once per module."""
+    return build_planning_prompt(_story(), _project())
+
+
 class TestBuildPlanningPrompt:
-    def test_returns_prompts(self):
-        system, user = build_planning_prompt(_story(), _project())
+    def test_returns_prompts(self, planning_prompts):
+        system, user = planning_prompts
         assert isinstance(system, str)
         assert isinstance(user, str)
 
-    def test_includes_completion_marker_instruction(self):
-        system, user = build_planning_prompt(_story(), _project())
+    def test_includes_completion_marker_instruction(self, planning_prompts):
+        system, user = planning_prompts
         assert COMPLETION_MARKER in system or COMPLETION_MARKER in user
 
 
@@ -0,0 +1,268 @@
+"""Tests for GitHub SCM provider."""
+
+from __future__ import annotations
+
+import subprocess
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from opd.capabilities.base import HealthStatus
+from opd.providers.scm.github import GitHubProvider
+
+
+def _fake_github(**attrs):
+    """Stand-in for github.Github whose requester has seen no responses yet."""
+    requester = SimpleNamespace(rate_limiting=(-1, -1), rate_limiting_resettime=0)
+    return SimpleNamespace(requester=requester, close=lambda: None, **attrs)
+
+
+@pytest.fixture
+def github():
+    prov = GitHubProvider({"token": "tok"})
+    prov._github = _fake_github(get_repo=lambda name: None)
+    return prov
+
+
+def _fake_pull(reviews=(), comments=()):
+    return SimpleNamespace(
+        get_reviews=lambda: list(reviews), get_review_comments=lambda: list(comments),
+    )
+
+
+class TestGetReviewComments:
+    async def test_flattens_reviews_and_comments(self, github):
+        pulls = []
+        pr = _fake_pull(
+            reviews=[
+                SimpleNamespace(body="Looks good", user=SimpleNamespace(login="alice")),
+                SimpleNamespace(body="", user=SimpleNamespace(login="bob")),
+            ],
+            comments=[SimpleNamespace(body="rename this", path="x.py", user=None)],
+        )
+        repo = SimpleNamespace(get_pull=lambda n: pulls.append(n) or pr)
+        github._github = _fake_github(get_repo=lambda name: repo)
+
+        comments = await github.get_review_comments("https://github.com/o/r", 7)
+        assert pulls == [7]
+        assert comments == [
+            {"user": "alice", "body": "Looks good"},
+            {"user": "ghost", "body": "rename this", "path": "x.py"},
+        ]
+
+
+class TestRepoCache:
+    async def test_reuses_repo_within_ttl(self, github):
+        calls = []
+        repo = SimpleNamespace()
+        github._github = _fake_github(get_repo=lambda name: calls.append(name) or repo)
+
+        assert await github._get_repo("https://github.com/o/r") is repo
+        assert await github._get_repo("https://github.com/o/r.git") is repo
+        assert calls == ["o/r"]
+
+    async def test_refetches_after_ttl(self, github):
+        calls = []
+        github._github = _fake_github(get_repo=lambda name: calls.append(name))
+
+        await github._get_repo("https://github.com/o/r")
+        fetched_at, repo = github._repo_cache["o/r"]
+        github._repo_cache["o/r"] = (fetched_at - 61, repo)
+        await github._get_repo("https://github.com/o/r")
+        assert len(calls) == 2
+
+    async def test_cleanup_clears_cache(self, github):
+        await github._get_repo("https://github.com/o/r")
+        await github.cleanup()
+        assert github._repo_cache == {}
+
+
+class TestRepoHandles:
+    def test_open_repo_reuses_and_evicts(self, github, tmp_path):
+        opened = []
+        github._pygit2 = SimpleNamespace(
+            Repository=lambda path: opened.append(path) or SimpleNamespace(path=path),
+        )
+        first = github._open_repo(str(tmp_path))
+        assert github._open_repo(str(tmp_path / ".")) is first
+        assert len(opened) == 1
+
+        for i in range(8):
+            github._open_repo(str(tmp_path / f"r{i}"))
+        assert github._open_repo(str(tmp_path)) is not first
+        assert len(opened) == 10
+
+
+def _fake_pygit2_repo(push_message):
+    """Working tree whose origin answers push_update_reference with ``push_message``."""
+    def push(refspecs, callbacks):
+        callbacks.push_update_reference(refspecs[0], push_message)
+
+    def noop(*args):
+        return None
+
+    return SimpleNamespace(
+        index=SimpleNamespace(read=noop, add_all=noop, write=noop, write_tree=lambda: "tree"),
+        default_signature="sig", head_is_unborn=True, create_commit=noop,
+        remotes={"origin": SimpleNamespace(push=push)},
+    )
+
+
+class TestPygit2Push:
+    @pytest.fixture
+    def pygit2(self, github):
+        github._pygit2 = pytest.importorskip("pygit2")
+        return github._pygit2
+
+    async def test_rejected_ref_raises(self, github, pygit2):
+        github._open_repo = lambda repo_dir: _fake_pygit2_repo("protected branch hook declined")
+        with pytest.raises(RuntimeError, match="protected branch hook declined"):
+            await github.commit_and_push("/repo", "opd/story-1", "msg")
+
+    async def test_accepted_ref_passes(self, github, pygit2):
+        github._open_repo = lambda repo_dir: _fake_pygit2_repo(None)
+        await github.commit_and_push("/repo", "opd/story-1", "msg")
+
+    def test_callbacks_without_token(self, github, pygit2):
+        github._token = ""
+        callbacks = github._pygit2_callbacks(pygit2)
+        assert isinstance(callbacks, pygit2.RemoteCallbacks)
+        assert callbacks.rejected == []
+
+
+def _git(cwd, *args) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True,
+    ).stdout
+
+
+@pytest.fixture
+def worktree(tmp_path):
+    """Clone with origin, where the agent edited a.txt and deleted c.txt."""
+    origin, work = tmp_path / "origin.git", tmp_path / "work"
+    _git(tmp_path, "init", "-q", "--bare", "-b", "main", str(origin))
+    _git(tmp_path, "init", "-q", "-b", "main", str(work))
+    _git(work, "config", "user.name", "opd")
+    _git(work, "config", "user.email", "opd@example.com")
+    (work / "a.txt").write_text("a\n")
+    (work / "c.txt").write_text("c\n")
+    _git(work, "add", "-A")
+    _git(work, "commit", "-q", "-m", "init")
+    _git(work, "remote", "add", "origin", str(origin))
+    (work / "a.txt").write_text("edited\n")
+    (work / "c.txt").unlink()
+    return work
+
+
+class TestGitBackends:
+    @pytest.mark.parametrize("backend", ["subprocess", "pygit2"])
+    async def test_branch_commit_push_keeps_worktree_changes(self, worktree, backend):
+        if backend == "pygit2":
+            pytest.importorskip("pygit2")
+        prov = GitHubProvider({"token": "", "git_backend": backend})
+        assert (prov._pygit2 is not None) == (backend == "pygit2")
+
+        await prov.create_branch(str(worktree), "opd/story-1")
+        assert not (worktree / "c.txt").exists()
+        assert (worktree / "a.txt").read_text() == "edited\n"
+
+        await prov.commit_and_push(str(worktree), "opd/story-1", "agent changes")
+        pushed = _git(worktree.parent / "origin.git", "ls-tree", "--name-only", "opd/story-1")
+        assert pushed.split() == ["a.txt"]
+        await prov.cleanup()
+
+    @pytest.mark.parametrize("backend", ["subprocess", "pygit2"])
+    @pytest.mark.parametrize("mode", [None, "full", "shallow"])
+    async def test_clone_modes(self, worktree, tmp_path, backend, mode):
+        if backend == "pygit2":
+            pytest.importorskip("pygit2")
+            if mode == "shallow":
+                pytest.skip("libgit2's local transport cannot fetch shallow")
+        _git(worktree, "commit", "-q", "-am", "second")
+        url = (worktree / ".git").as_uri()
+        prov = GitHubProvider({"token": "tok", "git_backend": backend, "clone_mode": mode})
+
+        await prov.clone_repo(url, str(tmp_path / "clone"))
+        clone = tmp_path / "clone"
+        assert _git(clone, "remote", "get-url", "origin").strip() == url
+        commits = int(_git(clone, "rev-list", "--count", "HEAD"))
+        assert commits == (1 if mode == "shallow" else 2)
+        await prov.cleanup()
+
+    async def test_pygit2_rejects_treeless(self, tmp_path):
+        pytest.importorskip("pygit2")
+        prov = GitHubProvider({"git_backend": "pygit2", "clone_mode": "treeless"})
+        with pytest.raises(ValueError, match="treeless"):
+            await prov.clone_repo("https://github.com/o/r", str(tmp_path / "clone"))
+
+    def test_subprocess_is_default(self):
+        assert GitHubProvider({"token": "tok"})._pygit2 is None
+
+
+class TestRateLimit:
+    def test_records_response_headers(self, github):
+        assert github._rate_limits == {}
+        github._note_rate_limit({"X-RateLimit-Remaining": "42", "X-RateLimit-Reset": "100"})
+        github._note_rate_limit({
+            "X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "200",
+            "X-RateLimit-Resource": "graphql",
+        })
+        assert github._rate_limits == {"core": (42, 100.0), "graphql": (3, 200.0)}
+
+    async def test_low_bucket_does_not_gate_other_resources(self, github):
+        github._rate_limits["graphql"] = (3, time.time() + 5)
+        with patch("opd.providers.scm.github.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await github._rate_limit_gate()
+        sleep.assert_not_called()
+
+    async def test_gate_waits_for_reset_when_quota_low(self, github):
+        github._rate_limits["core"] = (3, time.time() + 5)
+        with patch("opd.providers.scm.github.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await github._rate_limit_gate()
+        assert 0 < sleep.call_args.args[0] <= 5
+
+    async def test_gate_keeps_state_until_reset(self, github):
+        state = (3, time.time() + 600)
+        github._rate_limits["core"] = state
+        with patch("opd.providers.scm.github.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await github._rate_limit_gate()
+            await github._rate_limit_gate()
+        assert [c.args[0] for c in sleep.call_args_list] == [60, 60]
+        assert github._rate_limits["core"] == state
+
+    async def test_gate_forgets_state_after_reset(self, github):
+        github._rate_limits["core"] = (3, time.time() - 1)
+        with patch("opd.providers.scm.github.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await github._rate_limit_gate()
+        sleep.assert_not_called()
+        assert "core" not in github._rate_limits
+
+    async def test_gate_passes_when_quota_available(self, github):
+        github._rate_limits["core"] = (4000, time.time() + 5)
+        with patch("opd.providers.scm.github.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await github._rate_limit_gate()
+        sleep.assert_not_called()
+
+    async def test_github_call_reads_requester_state(self, github):
+        github._github.requester.rate_limiting = (120, 5000)
+        github._github.requester.rate_limiting_resettime = 1700000000
+        assert await github._github_call(lambda: "ok") == "ok"
+        assert github._rate_limits["core"] == (120, 1700000000.0)
+
+
+class TestHealthCache:
+    async def test_success_is_reused(self, github):
+        probe = AsyncMock(return_value=HealthStatus(healthy=True, message="ok"))
+        with patch.object(github, "_probe_health", probe):
+            await github.health_check()
+            await github.health_check()
+        assert probe.await_count == 1
+
+    async def test_failure_is_not_cached(self, github):
+        probe = AsyncMock(return_value=HealthStatus(healthy=False, message="401"))
+        with patch.object(github, "_probe_health", probe):
+            await github.health_check()
+            await github.health_check()
+        assert probe.await_count == 2
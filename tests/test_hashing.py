@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import hashlib
 from types import SimpleNamespace
-from unittest.mock import patch
 
+import pytest
 
 from opd.engine.hashing import (
     STAGE_INPUT_MAP,
@@ -15,6 +15,17 @@ from opd.engine.hashing import (
     should_skip_ai,
 )
 
+# Golden SHA-256 digests of the stage inputs used below
+PRD_HASH = "50deba1535f389f40572c4342269aec86275b39d2c8b228d17b0e35331d0f654"
+TD_HASH = "5d88852f20d44219e006662c22a44785ac1bd8b4e7af7a6c6f5ae332a65d4f00"
+DD_HASH = "ebd4f37380070b88e4429cdad2646f4ed271ebe0f78e6ee824e835ac38853eff"
+
+
+@pytest.fixture(autouse=True)
+def _no_doc(monkeypatch):
+    """No doc files on disk: stage input comes from the DB fields."""
+    monkeypatch.setattr("opd.engine.hashing.read_doc", lambda *a, **k: None)
+
 
 class TestComputeHash:
     def test_deterministic(self):
@@ -28,32 +39,25 @@ class TestComputeHash:
         assert len(h) == 64  # SHA-256 hex digest
         assert h == hashlib.sha256(b"test").hexdigest()
 
+    def test_golden_digests(self):
+        assert compute_hash("PRD content") == PRD_HASH
+        assert compute_hash("tech design content") == TD_HASH
+        assert compute_hash("detailed design content") == DD_HASH
+
     def test_empty_string(self):
         h = compute_hash("")
         assert len(h) == 64
 
 
 class TestStageInputMap:
-    def test_planning_mapping(self):
-        field, filename, hash_field, output_field = STAGE_INPUT_MAP["planning"]
-        assert field == "confirmed_prd"
-        assert filename == "prd.md"
-        assert hash_field == "planning_input_hash"
-        assert output_field == "technical_design"
-
-    def test_designing_mapping(self):
-        field, filename, hash_field, output_field = STAGE_INPUT_MAP["designing"]
-        assert field == "technical_design"
-        assert filename == "technical_design.md"
-        assert hash_field == "designing_input_hash"
-        assert output_field == "detailed_design"
-
-    def test_coding_mapping(self):
-        field, filename, hash_field, output_field = STAGE_INPUT_MAP["coding"]
-        assert field == "detailed_design"
-        assert filename == "detailed_design.md"
-        assert hash_field == "coding_input_hash"
-        assert output_field == "coding_report"
+    @pytest.mark.parametrize("stage,expected", [
+        ("planning", ("confirmed_prd", "prd.md", "planning_input_hash", "technical_design")),
+        ("designing", ("technical_design", "technical_design.md",
+                       "designing_input_hash", "detailed_design")),
+        ("coding", ("detailed_design", "detailed_design.md", "coding_input_hash", "coding_report")),
+    ])
+    def test_stage_mapping(self, stage, expected):
+        assert STAGE_INPUT_MAP[stage] == expected
 
     def test_unknown_stage_not_in_map(self):
         assert "verifying" not in STAGE_INPUT_MAP
@@ -61,18 +65,17 @@ class TestStageInputMap:
 
 
 class TestGetStageInputContent:
-    def test_reads_from_doc_file(self):
+    def test_reads_from_doc_file(self, monkeypatch):
         story = SimpleNamespace(confirmed_prd="docs/1/prd.md")
         project = SimpleNamespace(name="test")
-        with patch("opd.engine.hashing.read_doc", return_value="file content"):
-            content = get_stage_input_content(story, project, "planning")
+        monkeypatch.setattr("opd.engine.hashing.read_doc", lambda *a, **k: "file content")
+        content = get_stage_input_content(story, project, "planning")
         assert content == "file content"
 
     def test_falls_back_to_db_field(self):
         story = SimpleNamespace(confirmed_prd="inline PRD content")
         project = SimpleNamespace(name="test")
-        with patch("opd.engine.hashing.read_doc", return_value=None):
-            content = get_stage_input_content(story, project, "planning")
+        content = get_stage_input_content(story, project, "planning")
         assert content == "inline PRD content"
 
     def test_returns_none_for_unknown_stage(self):
@@ -83,30 +86,26 @@ class TestGetStageInputContent:
     def test_returns_none_when_no_content(self):
         story = SimpleNamespace(confirmed_prd=None)
         project = SimpleNamespace(name="test")
-        with patch("opd.engine.hashing.read_doc", return_value=None):
-            assert get_stage_input_content(story, project, "planning") is None
+        assert get_stage_input_content(story, project, "planning") is None
 
     def test_skips_db_field_if_path(self):
         """DB field starting with 'docs/' is a path, not inline content."""
         story = SimpleNamespace(confirmed_prd="docs/1/prd.md")
         project = SimpleNamespace(name="test")
-        with patch("opd.engine.hashing.read_doc", return_value=None):
-            assert get_stage_input_content(story, project, "planning") is None
+        assert get_stage_input_content(story, project, "planning") is None
 
 
 class TestComputeStageInputHash:
     def test_returns_hash_when_content_exists(self):
         story = SimpleNamespace(confirmed_prd="PRD content")
         project = SimpleNamespace(name="test")
-        with patch("opd.engine.hashing.read_doc", return_value=None):
-            h = compute_stage_input_hash(story, project, "planning")
-        assert h == compute_hash("PRD content")
+        h = compute_stage_input_hash(story, project, "planning")
+        assert h == PRD_HASH
 
     def test_returns_none_when_no_content(self):
         story = SimpleNamespace(confirmed_prd=None)
         project = SimpleNamespace(name="test")
-        with patch("opd.engine.hashing.read_doc", return_value=None):
-            assert compute_stage_input_hash(story, project, "planning") is None
+        assert compute_stage_input_hash(story, project, "planning") is None
 
     def test_returns_none_for_unknown_stage(self):
         story = SimpleNamespace()
@@ -128,15 +127,21 @@ class TestShouldSkipAI:
         defaults.update(kwargs)
         return SimpleNamespace(**defaults)
 
-    def test_skip_when_output_exists_and_hash_matches(self):
-        prd_hash = compute_hash("PRD content")
-        story = self._make_story(
-            technical_design="some design",
-            planning_input_hash=prd_hash,
-        )
+    @pytest.mark.parametrize("stage,input_field,output_field,hash_field,content,digest", [
+        ("planning", "confirmed_prd", "technical_design", "planning_input_hash",
+         "PRD content", PRD_HASH),
+        ("designing", "technical_design", "detailed_design", "designing_input_hash",
+         "tech design content", TD_HASH),
+        ("coding", "detailed_design", "coding_report", "coding_input_hash",
+         "detailed design content", DD_HASH),
+    ])
+    def test_skip_when_output_exists_and_hash_matches(self, stage, input_field, output_field,
+                                                      hash_field, content, digest):
+        story = self._make_story(**{
+            input_field: content, output_field: "existing output", hash_field: digest,
+        })
         project = SimpleNamespace(name="test")
-        with patch("opd.engine.hashing.read_doc", return_value=None):
-            assert should_skip_ai(story, project, "planning") is True
+        assert should_skip_ai(story, project, stage) is True
 
     def test_no_skip_when_hash_differs(self):
         story = self._make_story(
@@ -144,18 +149,15 @@ class TestShouldSkipAI:
             planning_input_hash="old_hash_that_doesnt_match",
         )
         project = SimpleNamespace(name="test")
-        with patch("opd.engine.hashing.read_doc", return_value=None):
-            assert should_skip_ai(story, project, "planning") is False
+        assert should_skip_ai(story, project, "planning") is False
 
     def test_no_skip_when_no_output(self):
-        prd_hash = compute_hash("PRD content")
         story = self._make_story(
             technical_design=None,
-            planning_input_hash=prd_hash,
+            planning_input_hash=PRD_HASH,
         )
         project = SimpleNamespace(name="test")
-        with patch("opd.engine.hashing.read_doc", return_value=None):
-            assert should_skip_ai(story, project, "planning") is False
+        assert should_skip_ai(story, project, "planning") is False
 
     def test_no_skip_when_no_stored_hash(self):
         story = self._make_story(
@@ -163,36 +165,13 @@ class TestShouldSkipAI:
             planning_input_hash=None,
         )
         project = SimpleNamespace(name="test")
-        with patch("opd.engine.hashing.read_doc", return_value=None):
-            assert should_skip_ai(story, project, "planning") is False
+        assert should_skip_ai(story, project, "planning") is False
 
     def test_no_skip_for_unknown_stage(self):
         story = self._make_story()
         project = SimpleNamespace(name="test")
         assert should_skip_ai(story, project, "verifying") is False
 
-    def test_designing_stage_skip(self):
-        td_hash = compute_hash("tech design content")
-        story = self._make_story(
-            technical_design="tech design content",
-            detailed_design="some detailed design",
-            designing_input_hash=td_hash,
-        )
-        project = SimpleNamespace(name="test")
-        with patch("opd.engine.hashing.read_doc", return_value=None):
-            assert should_skip_ai(story, project, "designing") is True
-
-    def test_coding_stage_skip(self):
-        dd_hash = compute_hash("detailed design content")
-        story = self._make_story(
-            detailed_design="detailed design content",
-            coding_report="some report",
-            coding_input_hash=dd_hash,
-        )
-        project = SimpleNamespace(name="test")
-        with patch("opd.engine.hashing.read_doc", return_value=None):
-            assert should_skip_ai(story, project, "coding") is True
-
     def test_input_change_detected_after_edit(self):
         """Simulate: user edits PRD after planning was generated."""
         old_hash = compute_hash("old PRD")
@@ -202,5 +181,4 @@ class TestShouldSkipAI:
             planning_input_hash=old_hash,
         )
         project = SimpleNamespace(name="test")
-        with patch("opd.engine.hashing.read_doc", return_value=None):
-            assert should_skip_ai(story, project, "planning") is False
+        assert should_skip_ai(story, project, "planning") is False
@@ -34,38 +34,41 @@ from conftest import MockAIProvider
 # ── Helpers ──
 
 
+_PROJECT_DEFAULTS = dict(
+    id=1, name="test", repo_url="https://github.com/t/r",
+    description="A test project", tech_stack="Python", architecture="monolith",
+    workspace_dir="/tmp/test-ws",
+)
+
+
 def _project(**kw):
-    defaults = dict(
-        id=1, name="test", repo_url="https://github.com/t/r",
-        description="A test project", tech_stack="Python", architecture="monolith",
-        rules=[], workspace_dir="/tmp/test-ws",
-    )
-    defaults.update(kw)
-    return SimpleNamespace(**defaults)
+    return SimpleNamespace(**{**_PROJECT_DEFAULTS, "rules": [], **kw})
+
+
+_STORY_DEFAULTS = dict(
+    id=1, title="Fix bug", raw_input="Fix the login bug",
+    status=StoryStatus.briefing, mode=StoryMode.light,
+    prd=None, confirmed_prd=None, technical_design=None,
+    detailed_design=None, coding_report=None, test_guide=None,
+    feature_tag=None,
+    planning_input_hash=None, designing_input_hash=None,
+    coding_input_hash=None,
+)
 
 
 def _story(**kw):
-    defaults = dict(
-        id=1, title="Fix bug", raw_input="Fix the login bug",
-        status=StoryStatus.briefing, mode=StoryMode.light,
-        prd=None, confirmed_prd=None, technical_design=None,
-        detailed_design=None, coding_report=None, test_guide=None,
-        feature_tag=None, tasks=[], clarifications=[],
-        planning_input_hash=None, designing_input_hash=None,
-        coding_input_hash=None,
-    )
-    defaults.update(kw)
-    return SimpleNamespace(**defaults)
+    return SimpleNamespace(**{**_STORY_DEFAULTS, "tasks": [], "clarifications": [], **kw})
+
+
+_ROUND_DEFAULTS = dict(
+    id=1, round_number=1, type=RoundType.initial,
+    status=RoundStatus.active, branch_name="",
+    close_reason=None,
+)
 
 
 def _round(**kw):
-    defaults = dict(
-        id=1, round_number=1, type=RoundType.initial,
-        status=RoundStatus.active, branch_name="",
-        pull_requests=[], close_reason=None,
-    )
-    defaults.update(kw)
-    return SimpleNamespace(**defaults)
+    return SimpleNamespace(**{**_ROUND_DEFAULTS, "pull_requests": [], **kw})
 
 
 def _make_ctx(story=None, project=None, round_=None, registry=None, publish=None):
@@ -0,0 +1,29 @@
+"""Tests for app startup helpers."""
+
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+
+from opd.main import _setup_logging
+
+
+def test_setup_logging_can_be_torn_down_and_reinstalled(tmp_path, monkeypatch):
+    root = logging.getLogger()
+    # Start from an unconfigured root (pytest installs its own capture handlers)
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    config = SimpleNamespace(logging=SimpleNamespace(dir=str(tmp_path), level="info"))
+
+    handler, listener = _setup_logging(config)
+    assert root.handlers == [handler]
+    assert _setup_logging(config) is None  # already configured
+
+    root.removeHandler(handler)
+    listener.stop()
+    assert root.handlers == []
+
+    handler, listener = _setup_logging(config)
+    assert root.handlers == [handler]
+    root.removeHandler(handler)
+    listener.stop()
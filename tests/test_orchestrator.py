@@ -7,6 +7,10 @@ from opd.engine.orchestrator import TaskInfo
 from opd.engine.stages.base import Stage, StageResult
 
 
+def _published(orch, round_id):
+    """Last event queued for each subscriber of ``round_id`` (no event-loop round trip)."""
+    return [q._queue[-1] for q in orch._subscribers.get(round_id, []) if q._queue]
+
 
 class DummyStage(Stage):
     required_capabilities = ["ai"]
@@ -61,6 +65,14 @@ class TestOrchestrator:
         event = q.get_nowait()
         assert event["type"] == "test"
 
+    async def test_publish_routes_by_round(self, orchestrator):
+        orchestrator.subscribe("round-1")
+        orchestrator.subscribe("round-1")
+        orchestrator.subscribe("round-2")
+        await orchestrator.publish("round-1", {"type": "test"})
+        assert _published(orchestrator, "round-1") == [{"type": "test"}] * 2
+        assert _published(orchestrator, "round-2") == []
+
     def test_stop_nonexistent_task(self, orchestrator):
         assert orchestrator.stop_task("nonexistent") is False
 
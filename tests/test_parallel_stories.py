@@ -5,7 +5,6 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from fastapi.testclient import TestClient
 
 from opd.db.models import RoundStatus, RoundType, StoryStatus
 from opd.engine.orchestrator import Orchestrator, TaskInfo
@@ -109,6 +109,38 @@ class TestCapabilityRegistry:
         assert result.ok
         assert len(result.warnings) == 1
 
+    async def test_preflight_runs_checks_concurrently(self):
+        import asyncio
+
+        running = []
+        peak = []
+
+        class SlowProvider(MockProvider):
+            async def health_check(self) -> HealthStatus:
+                running.append(self)
+                peak.append(len(running))
+                await asyncio.sleep(0.01)
+                running.remove(self)
+                return HealthStatus(healthy=True)
+
+        reg = CapabilityRegistry()
+        reg._capabilities["ai"] = Capability("ai", SlowProvider())
+        reg._capabilities["scm"] = Capability("scm", SlowProvider())
+        result = await reg.preflight(required=["ai"], optional=["scm"])
+        assert result.ok
+        assert max(peak) == 2
+
+    async def test_preflight_raising_check_is_error(self):
+        class RaisingProvider(MockProvider):
+            async def health_check(self) -> HealthStatus:
+                raise RuntimeError("boom")
+
+        reg = CapabilityRegistry()
+        reg._capabilities["ai"] = Capability("ai", RaisingProvider())
+        result = await reg.preflight(required=["ai"])
+        assert not result.ok
+        assert "boom" in result.errors[0]
+
     async def test_cleanup(self):
         cleaned = []
 
@@ -141,6 +173,112 @@ class TestCapabilityRegistry:
         reg = CapabilityRegistry()
         assert reg._create_provider("unknown", "nope", {}) is None
 
+    async def test_create_reuses_instance_for_same_config(self):
+        inits = []
+
+        class CountingProvider(MockProvider):
+            async def initialize(self):
+                inits.append(self)
+
+        reg = CapabilityRegistry()
+        reg.register_provider("test", "mock", CountingProvider)
+        first = await reg.create("test", "mock", {"a": 1, "b": 2})
+        second = await reg.create("test", "mock", {"b": 2, "a": 1})
+        assert first is second
+        assert len(inits) == 1
+
+    async def test_create_distinguishes_config(self):
+        reg = CapabilityRegistry()
+        reg.register_provider("test", "mock", MockProvider)
+        first = await reg.create("test", "mock", {"a": 1})
+        second = await reg.create("test", "mock", {"a": 2})
+        assert first is not second
+
+    async def test_create_fresh_bypasses_cache(self):
+        reg = CapabilityRegistry()
+        reg.register_provider("test", "mock", MockProvider)
+        cached = await reg.create("test", "mock", {})
+        fresh = await reg.create_fresh("test", "mock", {})
+        assert fresh is not cached
+        assert await reg.create("test", "mock", {}) is cached
+
+    async def test_create_unknown_returns_none(self):
+        reg = CapabilityRegistry()
+        assert await reg.create("unknown", "nope", {}) is None
+        assert reg._instance_cache == {}
+
+    async def test_cleanup_includes_cached_instances(self):
+        cleaned = []
+
+        class TrackingProvider(MockProvider):
+            async def cleanup(self):
+                cleaned.append(self)
+
+        reg = CapabilityRegistry()
+        reg.register_provider("test", "mock", TrackingProvider)
+        await reg.create("test", "mock", {"a": 1})
+        await reg.cleanup()
+        assert len(cleaned) == 1
+        assert reg._instance_cache == {}
+
+    async def test_register_provider_cleans_up_replaced_instances(self):
+        cleaned = []
+
+        class TrackingProvider(MockProvider):
+            async def cleanup(self):
+                cleaned.append(self)
+
+        reg = CapabilityRegistry()
+        reg.register_provider("test", "mock", TrackingProvider)
+        old = await reg.create("test", "mock", {})
+        reg.register_provider("test", "mock", TrackingProvider)
+        new = await reg.create("test", "mock", {})
+        assert new is not old
+        assert cleaned == [old]
+
+    async def test_create_evicts_least_recently_used(self, monkeypatch):
+        monkeypatch.setattr("opd.capabilities.registry._MAX_CACHED_INSTANCES", 2)
+        cleaned = []
+
+        class TrackingProvider(MockProvider):
+            async def cleanup(self):
+                cleaned.append(self)
+
+        reg = CapabilityRegistry()
+        reg.register_provider("test", "mock", TrackingProvider)
+        first = await reg.create("test", "mock", {"token": "a"})
+        second = await reg.create("test", "mock", {"token": "b"})
+        assert await reg.create("test", "mock", {"token": "a"}) is first
+        await reg.create("test", "mock", {"token": "c"})
+        assert cleaned == [second]
+        assert len(reg._instance_cache) == 2
+        assert await reg.create("test", "mock", {"token": "a"}) is first
+
+    async def test_evicted_instance_in_use_is_not_cleaned_up(self, monkeypatch):
+        monkeypatch.setattr("opd.capabilities.registry._MAX_CACHED_INSTANCES", 1)
+        cleaned = []
+
+        class TrackingProvider(MockProvider):
+            async def cleanup(self):
+                cleaned.append(self)
+
+        reg = CapabilityRegistry()
+        reg.register_provider("test", "mock", TrackingProvider)
+        project_reg = await reg.with_project_overrides([
+            {"capability": "test", "provider_override": "mock", "config_override": {"a": 1}},
+        ])
+        in_use = project_reg.get("test").provider
+        await reg.create("test", "mock", {"a": 2})
+        assert in_use not in reg._instance_cache.values()
+        assert cleaned == []
+
+        del project_reg
+        await reg.create("test", "mock", {"a": 3})
+        assert in_use in cleaned
+
+        await reg.cleanup()
+        assert len(cleaned) == 3
+
     def test_create_temp_provider(self):
         reg = CapabilityRegistry()
         reg.register_provider("test", "mock", MockProvider)
@@ -162,6 +300,23 @@ class TestCapabilityRegistry:
         categories = [a["capability"] for a in available]
         assert "custom" in categories
 
+    def test_list_available_caches_catalog_until_register(self):
+        reg = CapabilityRegistry()
+        reg.list_available()
+        catalog = reg._catalog
+        reg.list_available()
+        assert reg._catalog is catalog
+
+        reg.register_provider("custom", "my_prov", MockProvider)
+        assert "custom" in [a["capability"] for a in reg.list_available()]
+
+    def test_list_available_reports_current_active_provider(self):
+        reg = CapabilityRegistry()
+        reg.list_available()
+        reg._capabilities["ai"] = Capability("ai", MockProvider())
+        ai = next(a for a in reg.list_available() if a["capability"] == "ai")
+        assert ai["active_provider"] == "MockProvider"
+
     async def test_initialize_from_config(self):
         from opd.config import CapabilityConfig
 
@@ -1,9 +1,19 @@
 """Tests for the Story state machine."""
 
+from itertools import pairwise
+
 import pytest
 
 from opd.db.models import StoryStatus
-from opd.engine.state_machine import InvalidTransitionError, VALID_TRANSITIONS
+from opd.engine.state_machine import VALID_TRANSITIONS, InvalidTransitionError
+
+_HAPPY_PATH = ["preparing", "clarifying", "planning", "designing", "coding", "verifying", "done"]
+# Every edge in the table, and every other (src, dst) pair
+_VALID = [(src, dst) for src, dsts in VALID_TRANSITIONS.items() for dst in dsts]
+_INVALID = [
+    (src, dst) for src in StoryStatus for dst in StoryStatus
+    if dst not in VALID_TRANSITIONS.get(src, ())
+]
 
 
 class TestStateMachine:
@@ -13,15 +23,23 @@ class TestStateMachine:
             if status != StoryStatus.done:
                 assert status in VALID_TRANSITIONS
 
-    def test_forward_transitions(self, state_machine, mock_story):
-        """Happy path: preparing → clarifying → ... → done."""
-        path = ["clarifying", "planning", "designing", "coding", "verifying", "done"]
-        for next_status in path:
-            current = mock_story.status
-            current_val = current.value if hasattr(current, "value") else current
-            assert state_machine.can_transition(current_val, next_status)
-            state_machine.transition(mock_story, next_status)
-            assert mock_story.status == next_status
+    def test_happy_path_is_in_table(self):
+        """preparing → clarifying → ... → done; each edge is exercised by test_valid_transition."""
+        assert set(pairwise(_HAPPY_PATH)) <= set(_VALID)
+
+    @pytest.mark.parametrize("current,target", _VALID)
+    def test_valid_transition(self, state_machine, mock_story, current, target):
+        mock_story.status = current
+        assert state_machine.can_transition(current, target)
+        state_machine.transition(mock_story, target)
+        assert mock_story.status == target
+
+    @pytest.mark.parametrize("current,target", _INVALID)
+    def test_invalid_transition(self, state_machine, mock_story, current, target):
+        mock_story.status = current
+        assert not state_machine.can_transition(current, target)
+        with pytest.raises(InvalidTransitionError):
+            state_machine.transition(mock_story, target)
 
     def test_invalid_transition_raises(self, state_machine, mock_story):
         """Cannot skip stages."""